@@ -6,30 +6,38 @@ Yet another timing library. It aims to support every timing pattern:
 * Decorators:   wrap(fn: Callable) / @wrap
 * Contexts:     with Timer() as timer: pass
 
-For repeated performance measurements (microbenchmarks), use the builtin `timeit` library.
+For repeated performance measurements (microbenchmarks), use `Timer.measure_many()` or the builtin `timeit` library.
+
+The module functions only store the created `Timer` in the module attribute `prevtimer` if the module attribute
+`track_prevtimer` is set to `True`. It defaults to `False` to keep the functions free of side effects.
 """
 
+from __future__ import annotations
+
 import typing
 from .timing import (
     Timer,
     TimerStateError,
     TimerUnit,
+    TimerUnitLike,
     TimerResult,
     TimerCallback,
 )
 
 prevtimer = None
+track_prevtimer = False
 
 
 def start(*args, **kwargs) -> Timer:
     """
     Creates a new `Timer`, starts and returns it.
     * All arguments are passed to the `Timer` constructor.
-    * The created `Timer` may also be found in the module attribute `prevtimer`.
+    * The created `Timer` may also be found in the module attribute `prevtimer`, if `track_prevtimer` is set.
     """
     global prevtimer
     timer = Timer(*args, **kwargs)
-    prevtimer = timer
+    if track_prevtimer:
+        prevtimer = timer
     timer.start()
     return timer
 
@@ -38,11 +46,12 @@ def measure(fn: typing.Callable, **kwargs) -> typing.Any:
     """
     Creates a new `Timer`, times the Callable `fn` and returns the result.
     * All keyword arguments are passed to the `Timer` constructor.
-    * The created `Timer` may also be found in the module attribute `prevtimer`.
+    * The created `Timer` may also be found in the module attribute `prevtimer`, if `track_prevtimer` is set.
     """
     global prevtimer
     timer = Timer(**kwargs)
-    prevtimer = timer
+    if track_prevtimer:
+        prevtimer = timer
     return timer.measure(fn)
 
 
@@ -52,18 +61,11 @@ def wrap(fn: typing.Optional[typing.Callable] = None, **kwargs) -> typing.Callab
     * Decorator:             wrap(fn: Callable, **kwargs) / @wrap
     * Decorator Generator:   wrap(**kwargs)(fn: Callable) / @wrap(**kwargs)
     * All keyword arguments are passed to the `Timer` constructor.
-    * The created `Timer` may also be found in the module attribute `prevtimer`, directly after wrapping.
+    * The created `Timer` may also be found in the module attribute `prevtimer`, directly after wrapping, if
+      `track_prevtimer` is set.
     """
     global prevtimer
     timer = Timer(**kwargs)
-    prevtimer = timer
-    if fn:
-        def timed():
-            return timer.measure(fn)
-        return timed
-    else:
-        def decorator(fn: typing.Callable):
-            def timed():
-                return timer.measure(fn)
-            return timed
-        return decorator
+    if track_prevtimer:
+        prevtimer = timer
+    return timer.wrap(fn)
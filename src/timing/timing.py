@@ -4,13 +4,69 @@
 Classes and types for the timing library.
 """
 
+from __future__ import annotations
+
+import enum
+import sys
 import typing
 import time
+from functools import partial
+from itertools import repeat
+
+
+class TimerUnit(enum.IntEnum):
+    """
+    Units supported by the timer. The value of each unit is its length in nanoseconds.
+    * The unit names in lowercase (e.g. `"seconds"`) are accepted wherever a `TimerUnit` is expected.
+    """
+    NANOSECONDS = 1
+    MICROSECONDS = 1_000
+    MILLISECONDS = 1_000_000
+    SECONDS = 1_000_000_000
+
+    @classmethod
+    def _missing_(cls, value: object) -> typing.Optional[TimerUnit]:
+        """ Looks up units given by their name, e.g. `TimerUnit("seconds")`. """
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
+
 
-TimerUnit = typing.Literal["seconds", "milliseconds", "microseconds", "nanoseconds"]
+TimerUnitLike = typing.Union[TimerUnit, typing.Literal["seconds", "milliseconds", "microseconds", "nanoseconds"]]
 TimerResult = typing.Union[int, float]
 TimerCallback = typing.Callable[[TimerResult], None]
 
+perf_counter_ns = time.perf_counter_ns
+
+_UNIT_CONVERT = {
+    TimerUnit.NANOSECONDS: lambda r: r,
+    TimerUnit.MICROSECONDS: lambda r: r / 1e3,
+    TimerUnit.MILLISECONDS: lambda r: r / 1e6,
+    TimerUnit.SECONDS: lambda r: r / 1e9,
+}
+
+# maps the interned unit names to units, so that common lookups are resolved by identity
+_UNITS = {sys.intern(unit.name.lower()): unit for unit in TimerUnit}
+
+
+def _to_unit(unit: TimerUnitLike) -> TimerUnit:
+    """
+    Converts a `TimerUnit` or its name to a `TimerUnit`.
+    * Raises `ValueError` if the unit is not supported. Plain integers are not accepted as units.
+    """
+    if isinstance(unit, TimerUnit):
+        return unit
+    if isinstance(unit, str):
+        try:
+            return _UNITS[unit]
+        except KeyError:
+            return TimerUnit(unit)
+    raise ValueError(f"Unsupported unit {unit!r}.")
+
+
+def _noop(_result: TimerResult) -> None:
+    """ Callback used if no callback is set. """
+
 
 class TimerStateError(Exception):
     """ Raised if the operation is not permitted in the current timer state. """
@@ -24,17 +80,55 @@ class Timer:
     * Decorators:   wrap(fn: Callable) / @wrap
     * Contexts:     with Timer() as timer: pass
     """
-    __slots__ = ("starttime", "result", "unit", "callback")
-    starttime: typing.Optional[int]
-    result: typing.Optional[int]
-    unit: TimerUnit
-    callback: typing.Optional[TimerCallback]
-
-    def __init__(self, unit: TimerUnit = "seconds", callback: typing.Optional[TimerCallback] = None) -> None:
-        self.starttime = None
+    # plain slots: packing `starttime` and `result` into an `array("q")` would use more memory per timer and box on access
+    __slots__ = ("_state", "starttime", "result", "_unit", "_convert", "_callback", "_now")
+    _state: int  # 1 while running, otherwise 0
+    starttime: int  # only valid while running
+    result: typing.Optional[TimerResult]  # nanoseconds, a `float` only after `measure_many()`
+    _unit: TimerUnit
+    _convert: typing.Callable[[int], TimerResult]
+    _callback: TimerCallback
+    _now: typing.Callable[[], int]
+
+    def __init__(self, unit: TimerUnitLike = TimerUnit.SECONDS, callback: typing.Optional[TimerCallback] = None, clock: typing.Callable[[], int] = perf_counter_ns) -> None:
+        """
+        Creates a stopped timer.
+        * The `clock` returns the current time in nanoseconds and defaults to `time.perf_counter_ns()`.
+        * Raises `ValueError` if the unit is not supported.
+        """
+        self._state = 0
+        self.starttime = 0
         self.result = None
         self.unit = unit
         self.callback = callback
+        self._now = clock
+
+    @property
+    def unit(self) -> TimerUnit:
+        """ The default unit of the results. """
+        return self._unit
+
+    @unit.setter
+    def unit(self, unit: TimerUnitLike) -> None:
+        """ Sets the default unit and binds its conversion. Raises `ValueError` if the unit is not supported. """
+        unit = _to_unit(unit)
+        self._convert = _UNIT_CONVERT[unit]
+        self._unit = unit
+
+    @property
+    def running(self) -> bool:
+        """ Whether the timer is running. """
+        return self._state == 1
+
+    @property
+    def callback(self) -> typing.Optional[TimerCallback]:
+        """ The default callback called with the results. """
+        return None if self._callback is _noop else self._callback
+
+    @callback.setter
+    def callback(self, callback: typing.Optional[TimerCallback]) -> None:
+        """ Sets the default callback. A falsy callback disables the default callback. """
+        self._callback = callback or _noop
 
     def start(self, replace: bool = False, clear: bool = True) -> None:
         """
@@ -43,13 +137,14 @@ class Timer:
         * Give `clear=False` to keep the current result.
         * Raises `TimerStateError` if the timer is already running and `replace` is falsy.
         """
-        if self.starttime is not None and not replace:
+        if self._state == 1 and not replace:
             raise TimerStateError("The timer is already running. Give `replace=True` to restart the timer anyway.")
-        self.starttime = time.time_ns()
+        self.starttime = self._now()
+        self._state = 1
         if clear:
             self.result = None
 
-    def current(self, unit: typing.Optional[TimerUnit] = None, callback: typing.Union[bool, TimerCallback] = True) -> TimerResult:
+    def current(self, unit: typing.Optional[TimerUnitLike] = None, callback: typing.Union[bool, TimerCallback] = True) -> TimerResult:
         """
         Saves the currently elapsed time as the result but does not stop the timer.
         * Returns the current result. See `get()` for help of the `unit` argument.
@@ -60,12 +155,12 @@ class Timer:
         * Raises `TimerStateError` if the timer is not running.
         * Raises `ValueError` if the unit is not supported.
         """
-        if self.starttime is None:
+        if self._state != 1:
             raise TimerStateError("The timer is not running.")
-        self.result = time.time_ns() - self.starttime
+        self.result = self._now() - self.starttime
         return self._get_and_callback(unit=unit, callback=callback)
 
-    def stop(self, unit: typing.Optional[TimerUnit] = None, callback: typing.Union[bool, TimerCallback] = True) -> TimerResult:
+    def stop(self, unit: typing.Optional[TimerUnitLike] = None, callback: typing.Union[bool, TimerCallback] = True) -> TimerResult:
         """
         Stops the timer.
         * Returns the current result. See `get()` for help of the `unit` argument.
@@ -76,13 +171,13 @@ class Timer:
         * Raises `TimerStateError` if the timer is not running.
         * Raises `ValueError` if the unit is not supported.
         """
-        if self.starttime is None:
+        if self._state != 1:
             raise TimerStateError("The timer is not running.")
-        self.result = time.time_ns() - self.starttime
-        self.starttime = None
+        self.result = self._now() - self.starttime
+        self._state = 0
         return self._get_and_callback(unit=unit, callback=callback)
 
-    def restart(self, clear: bool = True, unit: typing.Optional[TimerUnit] = None, callback: typing.Union[bool, TimerCallback] = True) -> TimerResult:
+    def restart(self, clear: bool = True, unit: typing.Optional[TimerUnitLike] = None, callback: typing.Union[bool, TimerCallback] = True) -> TimerResult:
         """
         Stops the timer and restarts it again.
         * Give `clear=False` to keep the previous result.
@@ -98,29 +193,25 @@ class Timer:
         self.start(clear=clear)
         return ret
 
-    def get(self, unit: typing.Optional[TimerUnit] = None) -> TimerResult:
+    def get(self, unit: typing.Optional[TimerUnitLike] = None) -> TimerResult:
         """
         Gets the current result in the given unit. Defaults to `self.unit` if no unit is given.
+        * Results in nanoseconds are returned unchanged, i.e. as exact `int` except after `measure_many()`. All other units
+          are returned as `float`.
         * Raises `TimerStateError` if no result is available.
         * Raises `ValueError` if the unit is not supported.
         """
         if self.result is None:
             raise TimerStateError("No result available. Use `stop()` or exit the context before accessing the result.")
-        if unit is None:
-            unit = self.unit
-        ret = self.result
-        if unit == "nanoseconds":
-            return ret
-        if unit == "microseconds":
-            return ret / 1e3
-        if unit == "milliseconds":
-            return ret / 1e6
-        if unit == "seconds":
-            return ret / 1e9
-        else:
-            raise ValueError(f"Unsupported unit \"{unit}\".")
+        if unit is None or unit is self._unit:
+            return self._convert(self.result)
+        try:
+            unit = _UNITS[unit]
+        except (KeyError, TypeError):
+            unit = _to_unit(unit)
+        return _UNIT_CONVERT[unit](self.result)
 
-    def _get_and_callback(self, unit: typing.Optional[TimerUnit] = None, callback: typing.Union[None, bool, TimerCallback] = True) -> TimerResult:
+    def _get_and_callback(self, unit: typing.Optional[TimerUnitLike] = None, callback: typing.Union[None, bool, TimerCallback] = True) -> TimerResult:
         """
         Gets the current result and calls the callback.
         * The unit defaults to `self.unit` if no unit is given.
@@ -133,12 +224,12 @@ class Timer:
         """
         ret = self.get(unit=unit)
         if callback is True:
-            callback = self.callback
-        if callback:
+            self._callback(ret)
+        elif callback:
             callback(ret)
         return ret
 
-    def __enter__(self) -> "Timer":
+    def __enter__(self) -> Timer:
         """ Calls `start()` and returns `self`. """
         self.start()
         return self
@@ -152,7 +243,7 @@ class Timer:
         self.stop(callback=callback)
         return False  # don't suppress the exception
 
-    def measure(self, fn: typing.Callable, unit: typing.Optional[TimerUnit] = None, callback: typing.Union[bool, TimerCallback] = True) -> typing.Any:
+    def measure(self, fn: typing.Callable, unit: typing.Optional[TimerUnitLike] = None, callback: typing.Union[bool, TimerCallback] = True) -> typing.Any:
         """
         Times the Callable `fn` using this timer.
         * Returns the result of the Callable `fn`.
@@ -165,29 +256,80 @@ class Timer:
         * Raises `TimerStateError` if the timer is already running.
         * Raises `ValueError` if the unit is not supported.
         """
-        self.start()
-        try:
-            ret = fn()
-        except:
-            self.stop(callback=False)
-            raise
-        else:
-            self.stop(unit=unit, callback=callback)
+        ret = self._time(fn)
+        self._get_and_callback(unit=unit, callback=callback)
         return ret
 
-    def wrap(self, fn: typing.Optional[typing.Callable] = None, **kwargs) -> typing.Callable:
+    def measure_many(self, fn: typing.Callable, number: int = 1_000_000, unit: typing.Optional[TimerUnitLike] = None, callback: typing.Union[bool, TimerCallback] = True) -> TimerResult:
+        """
+        Times `number` calls of the Callable `fn` using this timer, reading the clock only once before and after all calls.
+        * Stores and returns the average duration of a single call. See `get()` for help of the `unit` argument.
+        * The stored `result` is the exact average in nanoseconds as a `float`, so it is not rounded to whole nanoseconds.
+        * The results of the Callable `fn` are discarded.
+        * Calls the given callback with the timer result:
+            * If `callback is True`, `self.callback` will be used.
+            * If `callback is False`, no callback will be called.
+            * Otherwise the argument is called.
+            * If the Callable `fn` raises an exception, no callback will be called, but the timer will be stopped anyway.
+              The `result` is then the total duration in nanoseconds of all calls made, like in `measure()`.
+        * Raises `TimerStateError` if the timer is already running.
+        * Raises `ValueError` if `number` is not positive or the unit is not supported.
+        """
+        if number < 1:
+            raise ValueError(f"The number of calls must be positive, got {number}.")
+
+        def call_many() -> None:
+            for _ in repeat(None, number):
+                fn()
+
+        self._time(call_many)
+        self.result /= number
+        return self._get_and_callback(unit=unit, callback=callback)
+
+    def wrap(self, fn: typing.Optional[typing.Callable] = None, *, unit: typing.Optional[TimerUnitLike] = None, callback: typing.Union[bool, TimerCallback] = True) -> typing.Callable:
         """
         Implements the decorator pattern for the `measure()` method:
-        * Decorator:             wrap(fn: Callable, **kwargs) / @wrap
-        * Decorator Generator:   wrap(**kwargs)(fn: Callable) / @wrap(**kwargs)
+        * Decorator:             wrap(fn: Callable, *, unit=None, callback=True) / @wrap
+        * Decorator Generator:   wrap(*, unit=None, callback=True)(fn: Callable) / @wrap(unit=..., callback=...)
+        * The keyword-only arguments `unit` and `callback` are passed to `measure()`.
         """
         if fn:
-            def timed():
-                return self.measure(fn, **kwargs)
-            return timed
+            return self._wrap(fn, unit, callback)
         else:
             def decorator(fn: typing.Callable):
-                def timed():
-                    return self.measure(fn, **kwargs)
-                return timed
+                return self._wrap(fn, unit, callback)
             return decorator
+
+    def _wrap(self, fn: typing.Callable, unit: typing.Optional[TimerUnitLike], callback: typing.Union[bool, TimerCallback]) -> typing.Callable:
+        """
+        Wraps the Callable `fn` to be timed by `measure()`.
+        * If the default unit and callback are used, a specialized closure is returned which behaves like `measure()` with
+          the default unit and callback, but saves the calls of the generic methods.
+        """
+        if unit is not None or callback is not True:
+            return partial(self.measure, fn, unit, callback)
+
+        def timed():
+            ret = self._time(fn)
+            self._callback(self._convert(self.result))
+            return ret
+        return timed
+
+    def _time(self, fn: typing.Callable) -> typing.Any:
+        """
+        Starts the timer, calls the Callable `fn` and stops the timer, storing the elapsed nanoseconds as the result.
+        * Returns the result of the Callable `fn`.
+        * The timer is stopped even if the Callable `fn` raises an exception. No callback is called.
+        * Raises `TimerStateError` if the timer is already running.
+        """
+        if self._state == 1:
+            raise TimerStateError("The timer is already running.")
+        now = self._now
+        self.starttime = starttime = now()
+        self.result = None
+        self._state = 1
+        try:
+            return fn()
+        finally:
+            self._state = 0
+            self.result = now() - starttime
@@ -44,3 +44,17 @@ def test_wrap_decorator() -> None:
     assert checker.is_unset()
     timed_func()
     assert checker.is_close(.1)
+
+
+def test_prevtimer() -> None:
+    """ Test that `timing.prevtimer` is only set if `timing.track_prevtimer` is set. """
+    timing.prevtimer = None
+    timing.measure(lambda: None)
+    assert timing.prevtimer is None
+    timing.track_prevtimer = True
+    try:
+        timer = timing.start()
+        assert timing.prevtimer is timer
+    finally:
+        timing.track_prevtimer = False
+        timing.prevtimer = None
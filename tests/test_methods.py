@@ -7,7 +7,7 @@ Tests the timing library functionality available through the `Timer` class.
 import time
 import pytest
 from utils import ResultChecker, is_close
-from timing import Timer, TimerStateError, TimerResult
+from timing import Timer, TimerStateError, TimerResult, TimerUnit
 
 
 def check_is_close(checker: ResultChecker, val: TimerResult, ref: TimerResult) -> None:
@@ -29,11 +29,14 @@ def test_basic() -> None:
     with pytest.raises(TimerStateError):
         timer.get()
     assert checker.is_unset()
+    assert not timer.running
     timer.start()
+    assert timer.running
     time.sleep(.1)
     assert checker.is_unset()
     elapsed = timer.stop()
     check_is_close(checker, elapsed, .1)
+    assert not timer.running
     with timer:
         time.sleep(.2)
     assert checker.is_close(.2)
@@ -68,4 +71,175 @@ def test_units() -> None:
     assert is_close(timer.get("milliseconds"), 200)
     assert is_close(timer.get("microseconds"), 200_000)
     assert is_close(timer.get("nanoseconds"), 200_000_000)
+    assert isinstance(timer.get("nanoseconds"), int)
+    timer.unit = "nanoseconds"
+    assert isinstance(timer.get(), int)
 
+
+def test_invalid_unit() -> None:
+    """ Test that unsupported units are rejected. """
+    with pytest.raises(ValueError):
+        Timer(unit="minutes")
+    timer = Timer()
+    with timer:
+        pass
+    with pytest.raises(ValueError):
+        timer.get("minutes")
+    for unit in (True, 1_000, 1.0):
+        with pytest.raises(ValueError):
+            timer.get(unit)
+        with pytest.raises(ValueError):
+            timer.unit = unit
+    assert timer.get("SECONDS") == timer.get(TimerUnit.SECONDS)
+    with pytest.raises(ValueError):
+        timer.unit = "minutes"
+    assert timer.unit is TimerUnit.SECONDS
+    timer.unit = "nanoseconds"
+    assert timer.unit is TimerUnit.NANOSECONDS
+    assert timer.get() == timer.get("nanoseconds") == timer.get(TimerUnit.NANOSECONDS)
+
+
+def test_measure_exception() -> None:
+    """ Test that `measure()` stops the timer without calling the callback if the Callable raises. """
+    checker = ResultChecker()
+    timer = Timer(callback=checker.set_result)
+
+    def fail() -> None:
+        time.sleep(.1)
+        raise RuntimeError()
+
+    with pytest.raises(RuntimeError):
+        timer.measure(fail)
+    assert checker.is_unset()
+    assert is_close(timer.get(), .1)
+    timer.start()
+    with pytest.raises(TimerStateError):
+        timer.measure(lambda: None)
+    timer.stop()
+
+
+def test_clock() -> None:
+    """ Test the `Timer` with a custom clock. """
+    ticks = iter(range(0, 10_000_000_000, 1_500_000_000))
+    timer = Timer(unit="milliseconds", clock=lambda: next(ticks))
+    timer.start()
+    assert timer.current() == 1_500
+    assert timer.stop("nanoseconds") == 3_000_000_000
+    assert timer.measure(lambda: 42) == 42
+    assert timer.get("seconds") == 1.5
+
+
+def test_callback() -> None:
+    """ Test setting and overriding the callback. """
+    checker = ResultChecker()
+    other = ResultChecker()
+    timer = Timer(unit="nanoseconds", clock=lambda: 0)
+    assert timer.callback is None
+    with timer:
+        pass
+    timer.callback = checker.set_result
+    assert timer.callback == checker.set_result
+    timer.start()
+    timer.stop(callback=False)
+    assert checker.is_unset()
+    timer.start()
+    timer.stop(callback=other.set_result)
+    assert checker.is_unset()
+    assert other.is_equal(0)
+    timer.start()
+    timer.stop()
+    assert checker.is_equal(0)
+    timer.callback = None
+    assert timer.callback is None
+
+
+def test_measure_many() -> None:
+    """ Test the `measure_many()` method. """
+    checker = ResultChecker()
+    ticks = iter(range(0, 10_000_000, 1_000_000))
+    calls = []
+    timer = Timer(unit="milliseconds", callback=checker.set_result, clock=lambda: next(ticks))
+    assert timer.measure_many(lambda: calls.append(None), number=3) == 1_000_000 / 3 * 1e-6
+    assert len(calls) == 3
+    assert checker.is_equal(timer.get())
+    assert timer.get("nanoseconds") == 1_000_000 / 3
+    ticks = iter(range(10))
+    assert timer.measure_many(lambda: None, number=4, unit="nanoseconds") == .25
+    with pytest.raises(ValueError):
+        timer.measure_many(lambda: None, number=0)
+    ticks = iter(range(0, 100, 7))
+    calls = []
+
+    def fail_third() -> None:
+        calls.append(None)
+        if len(calls) == 3:
+            raise RuntimeError()
+
+    with pytest.raises(RuntimeError):
+        timer.measure_many(fail_third, number=10)
+    assert timer.get("nanoseconds") == 7
+    timer = Timer(unit="microseconds")
+    assert timer.measure_many(lambda: time.sleep(.001), number=10) >= 1_000
+
+
+def test_wrap_clock() -> None:
+    """ Test the specialized `wrap()` closure with a custom clock. """
+    ticks = iter(range(0, 10_000_000, 1_000_000))
+    checker = ResultChecker()
+    timer = Timer(unit="milliseconds", callback=checker.set_result, clock=lambda: next(ticks))
+    timed_func = timer.wrap(lambda: 42)
+    assert timed_func() == 42
+    assert checker.is_equal(1.0)
+    assert timer.get("nanoseconds") == 1_000_000
+    timer.unit = "nanoseconds"
+    timed_func()
+    assert checker.is_equal(1_000_000)
+    failing_func = timer.wrap(lambda: 1 / 0)
+    with pytest.raises(ZeroDivisionError):
+        failing_func()
+    assert checker.is_equal(1_000_000)
+    timer.start()
+    with pytest.raises(TimerStateError):
+        timed_func()
+
+
+def test_unit_consistency() -> None:
+    """ Test that the default unit and an explicitly given unit yield the same result. """
+    ticks = iter(range(0, 30, 3))
+    for unit in TimerUnit:
+        timer = Timer(unit=unit, clock=lambda: next(ticks))
+        with timer:
+            pass
+        assert timer.get() == timer.get(timer.unit.name.lower()) == timer.get(timer.unit)
+
+
+def test_unit_exact() -> None:
+    """ Test that unit conversions are correctly rounded. """
+    ticks = iter([0, 9_000, 0, 2_000])
+    timer = Timer(clock=lambda: next(ticks))
+    with timer:
+        pass
+    assert timer.get("milliseconds") == 0.009
+    assert timer.get("microseconds") == 9.0
+    with timer:
+        pass
+    assert timer.get() == 2e-06
+    assert timer.get("seconds") == 2e-06
+
+
+def test_clock_error() -> None:
+    """ Test that the timer does not stay running if the clock raises. """
+    ticks = iter([])
+    timer = Timer(clock=lambda: next(ticks))
+    with pytest.raises(StopIteration):
+        timer.start()
+    with pytest.raises(StopIteration):
+        timer.measure(lambda: None)
+    ticks = iter([0])
+    with pytest.raises(StopIteration):
+        timer.measure(lambda: None)
+    with pytest.raises(TimerStateError):
+        timer.get()
+    ticks = iter([0, 1])
+    timer.start()
+    assert timer.stop("nanoseconds") == 1